@@ -40,121 +40,71 @@ Angled Tip Direction:
 """
 
 import numpy as np
-import xml.etree.ElementTree as ET
-import trimesh
 import argparse
 import json
+import sys
 from pathlib import Path
 from geort.utils.config_utils import get_config
+from geort.utils.urdf_utils import parse_urdf_links, parse_urdf_for_links, resolve_mesh_path, load_mesh_cached, \
+    preload_meshes
 
 
-def parse_urdf(urdf_path):
-    """Parse URDF file and extract link information."""
-    tree = ET.parse(urdf_path)
-    root = tree.getroot()
+def parse_urdf(urdf_path, wanted=None):
+    """Parse URDF file and extract link information.
     
-    links = {}
-    for link in root.findall('link'):
-        link_name = link.get('name')
-        links[link_name] = {
-            'visual': [],
-            'collision': [],
-            'origin': None
-        }
-        
-        # Get visual meshes
-        for visual in link.findall('visual'):
-            geometry = visual.find('geometry')
-            origin = visual.find('origin')
-            
-            origin_xyz = [0, 0, 0]
-            origin_rpy = [0, 0, 0]
-            if origin is not None:
-                if origin.get('xyz'):
-                    origin_xyz = [float(x) for x in origin.get('xyz').split()]
-                if origin.get('rpy'):
-                    origin_rpy = [float(x) for x in origin.get('rpy').split()]
-            
-            if geometry is not None:
-                mesh = geometry.find('mesh')
-                if mesh is not None:
-                    links[link_name]['visual'].append({
-                        'file': mesh.get('filename'),
-                        'origin_xyz': origin_xyz,
-                        'origin_rpy': origin_rpy
-                    })
-        
-        # Get collision meshes
-        for collision in link.findall('collision'):
-            geometry = collision.find('geometry')
-            origin = collision.find('origin')
-            
-            origin_xyz = [0, 0, 0]
-            origin_rpy = [0, 0, 0]
-            if origin is not None:
-                if origin.get('xyz'):
-                    origin_xyz = [float(x) for x in origin.get('xyz').split()]
-                if origin.get('rpy'):
-                    origin_rpy = [float(x) for x in origin.get('rpy').split()]
-            
-            if geometry is not None:
-                mesh = geometry.find('mesh')
-                box = geometry.find('box')
-                sphere = geometry.find('sphere')
-                
-                if mesh is not None:
-                    links[link_name]['collision'].append({
-                        'type': 'mesh',
-                        'file': mesh.get('filename'),
-                        'origin_xyz': origin_xyz,
-                        'origin_rpy': origin_rpy
-                    })
-                elif box is not None:
-                    size = [float(x) for x in box.get('size').split()]
-                    links[link_name]['collision'].append({
-                        'type': 'box',
-                        'size': size,
-                        'origin_xyz': origin_xyz,
-                        'origin_rpy': origin_rpy
-                    })
-                elif sphere is not None:
-                    radius = float(sphere.get('radius'))
-                    links[link_name]['collision'].append({
-                        'type': 'sphere',
-                        'radius': radius,
-                        'origin_xyz': origin_xyz,
-                        'origin_rpy': origin_rpy
-                    })
-    
-    return links
-
-
-def load_mesh(mesh_path, urdf_dir):
-    """Load a mesh file."""
-    # Handle relative paths
-    if mesh_path.startswith('package://'):
-        mesh_path = mesh_path.replace('package://', '')
-    
-    full_path = Path(urdf_dir) / mesh_path
-    
-    if not full_path.exists():
-        # Try without 'meshes' prefix
-        alt_path = Path(urdf_dir) / mesh_path.split('meshes/')[-1]
-        if alt_path.exists():
-            full_path = alt_path
-        else:
-            print(f"Warning: Mesh file not found: {full_path}")
-            return None
+    If `wanted` is given, only those links are extracted (streaming parse).
+    """
+    if wanted is not None:
+        return parse_urdf_for_links(urdf_path, wanted)
+    return parse_urdf_links(urdf_path)
+
+
+def load_mesh(mesh_path, urdf_dir, messages=None):
+    """Load a mesh file.
+    
+    Warnings are appended to `messages` if given, printed otherwise.
+    """
+    report = print if messages is None else messages.append
+    full_path = resolve_mesh_path(mesh_path, urdf_dir)
+    if full_path is None:
+        tried_path = Path(urdf_dir) / mesh_path.replace('package://', '')
+        report(f"Warning: Mesh file not found: {tried_path}")
+        return None
     
     try:
-        mesh = trimesh.load(str(full_path))
+        mesh = load_mesh_cached(full_path)
         return mesh
     except Exception as e:
-        print(f"Error loading mesh {full_path}: {e}")
+        report(f"Error loading mesh {full_path}: {e}")
         return None
 
 
-def analyze_fingertip_geometry(link_data, urdf_dir, tip_axis=None, tip_axis_angle=None):
+def vertex_bounds(verts):
+    """Bounds (2, 3) of an (N, 3) vertex array.
+    
+    The tip vertex is found separately with an argmax over only the column
+    (or direction) that is actually needed.
+    """
+    return np.array([verts.min(axis=0), verts.max(axis=0)], dtype=np.float64)
+
+
+def tip_directions(tip_angles):
+    """Unit tip direction vectors for a list of (from_axis, to_axis, angle_deg) tuples.
+    
+    Returns a (k, 3) array; [cos, sin] on two distinct axes is already unit norm.
+    """
+    tip_angles = np.asarray(tip_angles, dtype=np.float64).reshape(-1, 3)
+    rows = np.arange(len(tip_angles))
+    angle_rad = np.deg2rad(tip_angles[:, 2])
+    
+    directions = np.zeros((len(tip_angles), 3))
+    directions[rows, tip_angles[:, 0].astype(int)] = np.cos(angle_rad)
+    directions[rows, tip_angles[:, 1].astype(int)] = np.sin(angle_rad)
+    return directions
+
+
+def analyze_fingertip_geometry(link_data, urdf_dir, tip_axis=None, tip_axis_angle=None, tip_batch=None,
+                               tip_direction=None):
     """Analyze fingertip geometry to suggest center_offset.
     
     Args:
@@ -163,15 +113,23 @@ def analyze_fingertip_geometry(link_data, urdf_dir, tip_axis=None, tip_axis_angl
         tip_axis: Axis along which fingertip points (0=X, 1=Y, 2=Z). If None, auto-detect.
         tip_axis_angle: Tuple of (from_axis, to_axis, angle_deg) to rotate the tip direction.
                        E.g., (1, 2, 30) means 30 degrees from Y-axis towards Z-axis.
+        tip_batch: Optional list. If given, angled tip estimates are deferred and appended
+                   here, to be filled in by resolve_angled_tips().
+        tip_direction: Precomputed unit direction for tip_axis_angle (see tip_directions()).
+    
+    The mesh centroid is not computed here; suggest_center_offset() calls
+    results['centroid_fn'] if it needs the centroid as a fallback.
     """
     results = {
         'bounds': None,
         'center': None,
         'centroid': None,
+        'centroid_fn': None,
         'tip_estimate': None,
         'mesh_type': None,
         'tip_axis_used': None,
-        'tip_direction': None
+        'tip_direction': None,
+        'messages': []
     }
     
     # Try to load collision mesh first
@@ -179,56 +137,58 @@ def analyze_fingertip_geometry(link_data, urdf_dir, tip_axis=None, tip_axis_angl
         collision_data = link_data['collision'][0]
         
         if collision_data['type'] == 'mesh':
-            mesh = load_mesh(collision_data['file'], urdf_dir)
+            mesh = load_mesh(collision_data['file'], urdf_dir, results['messages'])
             if mesh is not None:
                 results['mesh_type'] = 'collision_mesh'
-                results['bounds'] = mesh.bounds
-                results['center'] = mesh.bounds.mean(axis=0)
-                results['centroid'] = mesh.centroid
+                
+                # Projections / argmax are memory bound, so scan float32 vertices
+                verts = np.ascontiguousarray(mesh.vertices, dtype=np.float32)
+                
+                bounds = vertex_bounds(verts)
+                results['bounds'] = bounds
+                results['center'] = (bounds[0] + bounds[1]) * 0.5
+                results['centroid_fn'] = lambda: mesh.centroid
                 
                 # Determine tip direction
                 if tip_axis_angle is not None:
                     # Use rotated axis direction
                     from_axis, to_axis, angle_deg = tip_axis_angle
-                    angle_rad = np.deg2rad(angle_deg)
-                    
-                    # Create normalized direction vector
-                    direction = np.zeros(3)
-                    direction[from_axis] = np.cos(angle_rad)
-                    direction[to_axis] = np.sin(angle_rad)
-                    direction = direction / np.linalg.norm(direction)  # Normalize
+                    if tip_direction is None:
+                        tip_direction = tip_directions([tip_axis_angle])[0]
+                    direction = tip_direction
                     
                     results['tip_direction'] = direction
                     results['tip_axis_used'] = f"{angle_deg}° from axis {from_axis} to {to_axis}"
                     
-                    # Find vertex with maximum projection along this direction
-                    projections = mesh.vertices @ direction
-                    max_projection = np.max(projections)
-                    
-                    # Tip estimate is the point along direction at max projection distance
-                    # This ensures the tip_estimate is actually along the tip_direction
-                    tip_point = direction * max_projection
+                    if tip_batch is None:
+                        # Tip estimate is the vertex with maximum projection along this direction
+                        max_idx = np.argmax(verts @ direction.astype(np.float32))
+                        tip_point = np.take(mesh.vertices, max_idx, axis=0, mode='clip')
+                    else:
+                        # Filled in later by resolve_angled_tips()
+                        tip_batch.append((results, mesh, direction))
+                        tip_point = None
                     
                 elif tip_axis is not None:
                     # Use user-specified axis
                     use_axis = tip_axis
                     results['tip_axis_used'] = use_axis
-                    max_idx = np.argmax(mesh.vertices[:, use_axis])
-                    tip_point = mesh.vertices[max_idx]
+                    max_idx = verts[:, use_axis].argmax()
+                    tip_point = np.take(mesh.vertices, max_idx, axis=0, mode='clip')
                     
                 else:
                     # Auto-detect: find axis with largest extent
-                    bounds_range = mesh.bounds[1] - mesh.bounds[0]
-                    use_axis = np.argmax(bounds_range)
+                    bounds_range = bounds[1] - bounds[0]
+                    use_axis = int(np.argmax(bounds_range))
                     results['tip_axis_used'] = use_axis
-                    max_idx = np.argmax(mesh.vertices[:, use_axis])
-                    tip_point = mesh.vertices[max_idx]
+                    max_idx = verts[:, use_axis].argmax()
+                    tip_point = np.take(mesh.vertices, max_idx, axis=0, mode='clip')
                 
                 results['tip_estimate'] = tip_point
         
         elif collision_data['type'] == 'box':
-            size = np.array(collision_data['size'])
-            origin = np.array(collision_data['origin_xyz'])
+            size = collision_data['size']
+            origin = collision_data['origin_xyz']
             
             results['mesh_type'] = 'box'
             results['center'] = origin
@@ -237,7 +197,7 @@ def analyze_fingertip_geometry(link_data, urdf_dir, tip_axis=None, tip_axis_angl
         
         elif collision_data['type'] == 'sphere':
             radius = collision_data['radius']
-            origin = np.array(collision_data['origin_xyz'])
+            origin = collision_data['origin_xyz']
             
             results['mesh_type'] = 'sphere'
             results['center'] = origin
@@ -247,35 +207,107 @@ def analyze_fingertip_geometry(link_data, urdf_dir, tip_axis=None, tip_axis_angl
     # If no collision mesh, try visual mesh
     if results['mesh_type'] is None and link_data['visual']:
         visual_data = link_data['visual'][0]
-        mesh = load_mesh(visual_data['file'], urdf_dir)
+        mesh = load_mesh(visual_data['file'], urdf_dir, results['messages'])
         if mesh is not None:
             results['mesh_type'] = 'visual_mesh'
-            results['bounds'] = mesh.bounds
-            results['center'] = mesh.bounds.mean(axis=0)
-            results['centroid'] = mesh.centroid
+            verts = np.ascontiguousarray(mesh.vertices, dtype=np.float32)
+            bounds = vertex_bounds(verts)
+            results['bounds'] = bounds
+            results['center'] = (bounds[0] + bounds[1]) * 0.5
+            results['centroid_fn'] = lambda: mesh.centroid
             
             # Estimate tip point
-            max_z_idx = np.argmax(mesh.vertices[:, 2])
-            tip_point = mesh.vertices[max_z_idx]
+            max_z_idx = verts[:, 2].argmax()
+            tip_point = np.take(mesh.vertices, max_z_idx, axis=0, mode='clip')
             results['tip_estimate'] = tip_point
     
     return results
 
 
+def resolve_angled_tips(tip_batch):
+    """Fill in deferred angled tip estimates.
+    
+    Fingers sharing the same mesh are projected onto all their tip directions
+    with a single matrix product instead of one product per finger.
+    """
+    groups = {}
+    for results, mesh, direction in tip_batch:
+        groups.setdefault(id(mesh), (mesh, []))[1].append((results, direction))
+    
+    for mesh, entries in groups.values():
+        verts = np.ascontiguousarray(mesh.vertices, dtype=np.float32)
+        directions = np.stack([direction for _, direction in entries]).astype(np.float32)
+        projections = verts @ directions.T
+        max_idx = np.argmax(projections, axis=0)
+        
+        tip_points = np.take(mesh.vertices, max_idx, axis=0, mode='clip')
+        for (results, _), tip_point in zip(entries, tip_points):
+            results['tip_estimate'] = tip_point
+
+
 def suggest_center_offset(geometry_info):
     """Suggest a center_offset value based on geometry analysis."""
+    if geometry_info['tip_estimate'] is None and geometry_info['centroid'] is None \
+            and geometry_info.get('centroid_fn') is not None:
+        # Centroid is only integrated when it is actually needed
+        geometry_info['centroid'] = geometry_info['centroid_fn']()
+    
     if geometry_info['tip_estimate'] is not None:
         # The tip estimate is likely the best choice
-        return geometry_info['tip_estimate'].tolist()
+        offset = geometry_info['tip_estimate']
     elif geometry_info['centroid'] is not None:
         # Use centroid as fallback
-        return geometry_info['centroid'].tolist()
+        offset = geometry_info['centroid']
     elif geometry_info['center'] is not None:
         # Use bounding box center as last resort
-        return geometry_info['center'].tolist()
+        offset = geometry_info['center']
     else:
         # Default to origin
-        return [0.0, 0.0, 0.0]
+        offset = np.zeros(3)
+    # Convert to a plain list only here, at the JSON boundary
+    return np.asarray(offset, dtype=np.float64).tolist()
+
+
+def format_vec(vec, precision=4):
+    """Format a 3-vector for printing."""
+    return np.array2string(np.asarray(vec, dtype=np.float64), precision=precision,
+                           separator=', ', floatmode='fixed', suppress_small=True)
+
+
+AXIS_NAME_TO_INT = {'x': 0, 'y': 1, 'z': 2}
+
+
+def _parse_axis(axis):
+    try:
+        return AXIS_NAME_TO_INT[axis.lower()]
+    except KeyError:
+        raise argparse.ArgumentTypeError(f"invalid axis '{axis}'. Use x, y, or z.")
+
+
+def _parse_tip_axis(spec):
+    """argparse type for --tip-axes: 'finger:axis' -> (finger, axis_index)."""
+    parts = spec.split(':')
+    if len(parts) != 2:
+        raise argparse.ArgumentTypeError(f"invalid tip-axes format '{spec}'. Expected 'finger:axis'")
+    finger, axis = parts
+    return finger.lower(), _parse_axis(axis)
+
+
+def _parse_tip_angle(spec):
+    """argparse type for --tip-angles: 'finger:from:to:angle' -> (finger, (from, to, angle))."""
+    parts = spec.split(':')
+    if len(parts) != 4:
+        raise argparse.ArgumentTypeError(
+            f"invalid tip-angles format '{spec}'. Expected 'finger:from_axis:to_axis:angle'")
+    finger, from_axis, to_axis, angle = parts
+    from_idx, to_idx = _parse_axis(from_axis), _parse_axis(to_axis)
+    if from_idx == to_idx:
+        raise argparse.ArgumentTypeError(f"from_axis and to_axis must differ in '{spec}'")
+    try:
+        angle_val = float(angle)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid angle '{angle}' for finger '{finger}'")
+    return finger.lower(), (from_idx, to_idx, angle_val)
 
 
 def main():
@@ -294,51 +326,17 @@ Tip Axis Specification:
         """)
     parser.add_argument('--hand', type=str, default='dg5f_right',
                         help='Hand configuration name (default: dg5f_right)')
-    parser.add_argument('--tip-axes', nargs='*', default=[],
+    parser.add_argument('--tip-axes', nargs='*', default=[], type=_parse_tip_axis,
                         help='Specify tip axis for each finger (e.g., thumb:y index:z)')
-    parser.add_argument('--tip-angles', nargs='*', default=[],
+    parser.add_argument('--tip-angles', nargs='*', default=[], type=_parse_tip_angle,
                         help='Specify tip direction with angle offset (e.g., thumb:y:z:30 means 30° from Y towards Z)')
     parser.add_argument('--save', action='store_true',
                         help='Save suggested configuration to file')
     
     args = parser.parse_args()
     
-    # Parse tip axes
-    tip_axes_map = {}
-    tip_angles_map = {}
-    axis_name_to_int = {'x': 0, 'y': 1, 'z': 2}
-    
-    for spec in args.tip_axes:
-        if ':' in spec:
-            finger, axis = spec.split(':', 1)
-            axis_lower = axis.lower()
-            if axis_lower in axis_name_to_int:
-                tip_axes_map[finger.lower()] = axis_name_to_int[axis_lower]
-            else:
-                print(f"Warning: Invalid axis '{axis}' for finger '{finger}'. Use x, y, or z.")
-        else:
-            print(f"Warning: Invalid tip-axes format '{spec}'. Expected 'finger:axis'")
-    
-    for spec in args.tip_angles:
-        parts = spec.split(':')
-        if len(parts) == 4:
-            finger, from_axis, to_axis, angle = parts
-            from_axis_lower = from_axis.lower()
-            to_axis_lower = to_axis.lower()
-            if from_axis_lower in axis_name_to_int and to_axis_lower in axis_name_to_int:
-                try:
-                    angle_val = float(angle)
-                    tip_angles_map[finger.lower()] = (
-                        axis_name_to_int[from_axis_lower],
-                        axis_name_to_int[to_axis_lower],
-                        angle_val
-                    )
-                except ValueError:
-                    print(f"Warning: Invalid angle '{angle}' for finger '{finger}'")
-            else:
-                print(f"Warning: Invalid axes for finger '{finger}'. Use x, y, or z.")
-        else:
-            print(f"Warning: Invalid tip-angles format '{spec}'. Expected 'finger:from_axis:to_axis:angle'")
+    tip_axes_map = dict(args.tip_axes)
+    tip_angles_map = dict(args.tip_angles)
     
     # Load configuration
     config = get_config(args.hand)
@@ -353,26 +351,66 @@ Tip Axis Specification:
     
     # Parse URDF
     print(f"Parsing URDF: {urdf_path}")
-    links = parse_urdf(urdf_path)
+    wanted = {f['link'] for f in config['fingertip_link']}
+    links = parse_urdf(urdf_path, wanted)
     
     # Analyze each fingertip
     print("\nAnalyzing fingertips...\n")
     
+    # Angled tips are resolved in one batch after all meshes are loaded
+    geometries = {}
+    tip_batch = []
+    
+    # All angled tip directions in one vectorized call
+    angled_fingers = list(tip_angles_map)
+    direction_map = dict(zip(angled_fingers, tip_directions([tip_angles_map[f] for f in angled_fingers])))
+    
+    def analyze(finger_info, link_data):
+        finger_name = finger_info['name']
+        geometries[finger_name] = analyze_fingertip_geometry(
+            link_data, urdf_dir,
+            tip_axis=tip_axes_map.get(finger_name.lower()),
+            tip_axis_angle=tip_angles_map.get(finger_name.lower()),
+            tip_batch=tip_batch,
+            tip_direction=direction_map.get(finger_name.lower()))
+    
+    analyzed = [f for f in config['fingertip_link'] if f['link'] in links]
+    
+    # Mesh loads dominate and release the GIL: load every distinct collision
+    # mesh once in parallel, then analyze the fingers from the warm cache
+    preload_meshes(resolve_mesh_path(link_data['collision'][0]['file'], urdf_dir)
+                   for link_data in (links[f['link']] for f in analyzed)
+                   if link_data['collision'] and link_data['collision'][0]['type'] == 'mesh')
+    for finger_info in analyzed:
+        analyze(finger_info, links[finger_info['link']])
+    
+    # Visual meshes are only parsed for links whose collision geometry failed
+    failed = [f for f in analyzed if geometries[f['name']]['mesh_type'] is None]
+    if failed:
+        visual_links = parse_urdf_for_links(urdf_path, {f['link'] for f in failed}, parts=('visual',))
+        for finger_info in failed:
+            messages = geometries[finger_info['name']]['messages']
+            analyze(finger_info, visual_links[finger_info['link']])
+            # Keep the collision mesh warnings ahead of the visual ones
+            geometries[finger_info['name']]['messages'][:0] = messages
+    
+    resolve_angled_tips(tip_batch)
+    
+    # Report is collected and written in one go
     suggestions = []
+    lines = []
     
     for finger_info in config['fingertip_link']:
         finger_name = finger_info['name']
         link_name = finger_info['link']
         current_offset = finger_info['center_offset']
         
-        print("-" * 80)
-        print(f"Finger: {finger_name.upper()}")
-        print(f"Link: {link_name}")
-        print(f"Current offset: [{current_offset[0]:.4f}, {current_offset[1]:.4f}, {current_offset[2]:.4f}]")
+        lines.append("-" * 80)
+        lines.append(f"Finger: {finger_name.upper()}")
+        lines.append(f"Link: {link_name}")
+        lines.append(f"Current offset: {format_vec(current_offset)}")
         
         if link_name in links:
-            link_data = links[link_name]
-            
             # Get tip axis or angle for this finger (if specified)
             tip_axis = tip_axes_map.get(finger_name.lower())
             tip_angle = tip_angles_map.get(finger_name.lower())
@@ -380,37 +418,39 @@ Tip Axis Specification:
             if tip_angle is not None:
                 axis_names = ['X', 'Y', 'Z']
                 from_ax, to_ax, angle = tip_angle
-                print(f"Using angled tip: {angle}° from {axis_names[from_ax]} towards {axis_names[to_ax]}")
+                lines.append(f"Using angled tip: {angle}° from {axis_names[from_ax]} towards {axis_names[to_ax]}")
             elif tip_axis is not None:
                 axis_names = ['X', 'Y', 'Z']
-                print(f"Using specified tip axis: {axis_names[tip_axis]}")
+                lines.append(f"Using specified tip axis: {axis_names[tip_axis]}")
             
-            geometry = analyze_fingertip_geometry(link_data, urdf_dir, tip_axis=tip_axis, tip_axis_angle=tip_angle)
+            geometry = geometries[finger_name]
+            # Load warnings go in this finger's section, where they were raised
+            lines.extend(geometry['messages'])
             
-            print(f"Mesh type: {geometry['mesh_type']}")
+            lines.append(f"Mesh type: {geometry['mesh_type']}")
             if geometry['tip_direction'] is not None:
-                print(f"Tip direction: [{geometry['tip_direction'][0]:.3f}, {geometry['tip_direction'][1]:.3f}, {geometry['tip_direction'][2]:.3f}]")
+                lines.append(f"Tip direction: {format_vec(geometry['tip_direction'], precision=3)}")
             elif geometry['tip_axis_used'] is not None:
                 if isinstance(geometry['tip_axis_used'], int):
                     axis_names = ['X', 'Y', 'Z']
-                    print(f"Tip axis used: {axis_names[geometry['tip_axis_used']]}")
+                    lines.append(f"Tip axis used: {axis_names[geometry['tip_axis_used']]}")
                 else:
-                    print(f"Tip axis used: {geometry['tip_axis_used']}")
+                    lines.append(f"Tip axis used: {geometry['tip_axis_used']}")
             
             if geometry['bounds'] is not None:
-                print(f"Bounds min: [{geometry['bounds'][0][0]:.4f}, {geometry['bounds'][0][1]:.4f}, {geometry['bounds'][0][2]:.4f}]")
-                print(f"Bounds max: [{geometry['bounds'][1][0]:.4f}, {geometry['bounds'][1][1]:.4f}, {geometry['bounds'][1][2]:.4f}]")
+                lines.append(f"Bounds min: {format_vec(geometry['bounds'][0])}")
+                lines.append(f"Bounds max: {format_vec(geometry['bounds'][1])}")
+            
+            # Suggest offset (computes the centroid if it is needed as fallback)
+            suggested_offset = suggest_center_offset(geometry)
             
             if geometry['centroid'] is not None:
-                print(f"Centroid: [{geometry['centroid'][0]:.4f}, {geometry['centroid'][1]:.4f}, {geometry['centroid'][2]:.4f}]")
+                lines.append(f"Centroid: {format_vec(geometry['centroid'])}")
             
             if geometry['tip_estimate'] is not None:
-                tip = geometry['tip_estimate']
-                print(f"Tip estimate: [{tip[0]:.4f}, {tip[1]:.4f}, {tip[2]:.4f}]")
+                lines.append(f"Tip estimate: {format_vec(geometry['tip_estimate'])}")
             
-            # Suggest offset
-            suggested_offset = suggest_center_offset(geometry)
-            print(f"\n→ SUGGESTED offset: [{suggested_offset[0]:.4f}, {suggested_offset[1]:.4f}, {suggested_offset[2]:.4f}]")
+            lines.append(f"\n→ SUGGESTED offset: {format_vec(suggested_offset)}")
             
             suggestions.append({
                 'name': finger_name,
@@ -420,12 +460,13 @@ Tip Axis Specification:
                 'human_hand_id': finger_info['human_hand_id']
             })
         else:
-            print(f"Warning: Link '{link_name}' not found in URDF")
+            lines.append(f"Warning: Link '{link_name}' not found in URDF")
             suggestions.append(finger_info)
         
-        print()
+        lines.append("")
     
-    print("=" * 80)
+    lines.append("=" * 80)
+    sys.stdout.write("\n".join(lines) + "\n")
     
     # Save if requested
     if args.save:
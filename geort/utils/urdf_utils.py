@@ -0,0 +1,244 @@
+"""
+Shared URDF helpers for the fingertip analysis / visualization tools.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+import functools
+import inspect
+import mmap
+import os
+from pathlib import Path
+
+import numpy as np
+
+try:
+    import lxml.etree as ET
+except ImportError:
+    import xml.etree.ElementTree as ET
+
+
+def _parse_vec3(attr, default=None):
+    """Parse a whitespace separated attribute (e.g. xyz="0 0 0.1") into an ndarray."""
+    if not attr:
+        return np.zeros(3) if default is None else default
+    return np.fromstring(attr, sep=' ', dtype=np.float64)
+
+
+def _parse_origin(origin):
+    """Return (xyz, rpy) arrays from an <origin> element (or None)."""
+    if origin is None:
+        return np.zeros(3), np.zeros(3)
+    return _parse_vec3(origin.get('xyz')), _parse_vec3(origin.get('rpy'))
+
+
+def _parse_geometry(geometry):
+    """Return a dict describing a mesh / box / sphere <geometry> element, or None."""
+    if geometry is None:
+        return None
+
+    mesh = geometry.find('mesh')
+    if mesh is not None:
+        return {'type': 'mesh', 'file': mesh.get('filename')}
+
+    box = geometry.find('box')
+    if box is not None:
+        return {'type': 'box', 'size': _parse_vec3(box.get('size'))}
+
+    sphere = geometry.find('sphere')
+    if sphere is not None:
+        return {'type': 'sphere', 'radius': float(sphere.get('radius'))}
+
+    return None
+
+
+def _collect_geometry(link, tag):
+    """Parse all <visual> or <collision> children of a <link> element."""
+    collected = []
+    for elem in link.findall(tag):
+        geometry = _parse_geometry(elem.find('geometry'))
+        if geometry is None:
+            continue
+
+        origin_xyz, origin_rpy = _parse_origin(elem.find('origin'))
+        geometry['origin_xyz'] = origin_xyz
+        geometry['origin_rpy'] = origin_rpy
+        collected.append(geometry)
+    return collected
+
+
+def _collect_collision(link):
+    return _collect_geometry(link, 'collision')
+
+
+def _collect_visual(link):
+    # Visual geometry is only used when it is a mesh.
+    return [g for g in _collect_geometry(link, 'visual') if g['type'] == 'mesh']
+
+
+def parse_link(link, parts=('visual', 'collision')):
+    """Extract visual and/or collision geometry from a single <link> element."""
+    return {
+        'visual': _collect_visual(link) if 'visual' in parts else [],
+        'collision': _collect_collision(link) if 'collision' in parts else [],
+        'origin': None
+    }
+
+
+def parse_urdf_links(urdf_path):
+    """Parse URDF file and extract visual / collision geometry for every link."""
+    tree = ET.parse(str(urdf_path))
+    root = tree.getroot()
+
+    links = {}
+    for link in root.findall('link'):
+        links[link.get('name')] = parse_link(link)
+
+    return links
+
+
+def parse_urdf_for_links(urdf_path, wanted, parts=('collision',)):
+    """Stream through a URDF file and extract geometry only for the links in `wanted`
+    (all links if `wanted` is None).
+
+    Only the geometry kinds listed in `parts` are parsed; by default visual
+    geometry is skipped, callers do a second pass with parts=('visual',) for
+    the links whose collision geometry turned out to be unusable.
+    Elements are cleared as soon as they have been processed, so memory stays
+    bounded on large URDFs.
+    """
+    wanted = None if wanted is None else set(wanted)
+    links = {}
+    for _, elem in ET.iterparse(str(urdf_path), events=('end',)):
+        if elem.tag == 'link':
+            if wanted is None or elem.get('name') in wanted:
+                links[elem.get('name')] = parse_link(elem, parts)
+            elem.clear()
+        elif elem.tag == 'joint':
+            elem.clear()
+
+    return links
+
+
+@functools.lru_cache(maxsize=16)
+def _build_mesh_index_cached(urdf_dir_str):
+    index = {}
+    # Symlinks are not followed: a symlink loop would recurse without bound
+    for root, _, files in os.walk(urdf_dir_str):
+        for name in files:
+            path = os.path.join(root, name)
+            index[os.path.relpath(path, urdf_dir_str)] = path
+    return index
+
+
+def build_mesh_index(urdf_dir):
+    """Index every file below `urdf_dir` by its path relative to `urdf_dir`.
+
+    Built with a single directory walk and cached per directory, so mesh
+    paths that match it need no stat calls. The index is a snapshot with
+    exact, case-sensitive keys: files added later, paths behind symlinked
+    directories and case-insensitive matches are not in it, and
+    resolve_mesh_path() falls back to a filesystem check for those.
+    """
+    return _build_mesh_index_cached(os.path.abspath(urdf_dir))
+
+
+def resolve_mesh_path(mesh_path, urdf_dir):
+    """Resolve a mesh filename referenced in a URDF to an existing file (or None)."""
+    if mesh_path.startswith('package://'):
+        mesh_path = mesh_path.replace('package://', '')
+
+    index = build_mesh_index(urdf_dir)
+
+    # Exact path first, then without 'meshes' prefix
+    for candidate in [mesh_path, mesh_path.split('meshes/')[-1]]:
+        # Index hits need no stat; anything else (outside the URDF directory,
+        # behind a symlink, different case, added later) is checked on disk
+        path = index.get(os.path.normpath(candidate))
+        if path is not None:
+            return Path(path)
+        full_path = Path(urdf_dir) / candidate
+        if full_path.exists():
+            return full_path.resolve()
+
+    return None
+
+
+@functools.lru_cache(maxsize=None)
+def _trimesh_load_kwargs():
+    # Only bounds / vertices are needed downstream, so skip trimesh's
+    # vertex merging and normal recomputation as well as material loading.
+    from trimesh.exchange.obj import load_obj
+
+    kwargs = {'process': False, 'validate': False, 'force': 'mesh'}
+    # Older trimesh versions have no `skip_materials`.
+    if 'skip_materials' in inspect.signature(load_obj).parameters:
+        kwargs['skip_materials'] = True
+    return kwargs
+
+
+def _load_mesh_file(file_obj, file_type=None):
+    # trimesh is only imported once a mesh is actually loaded; URDF parsing
+    # and path resolution do not need it.
+    import trimesh
+
+    return trimesh.load(file_obj, file_type=file_type, **_trimesh_load_kwargs())
+
+
+@functools.lru_cache(maxsize=128)
+def _load_mesh_cached(path_str):
+    # Load errors are returned rather than raised so that they stay cached as
+    # well: a missing or broken file is only tried once. ImportError covers
+    # formats whose optional loader (e.g. pycollada for .dae) is not installed.
+    try:
+        return _load_mesh_mmap(path_str)
+    except (ValueError, OSError, ImportError) as e:
+        return e
+
+
+def _load_mesh_mmap(path_str):
+    # Memory-map the file so the OS pages it in directly. The mapping is only
+    # needed while parsing: the parsed mesh owns its own arrays.
+    with open(path_str, 'rb') as f:
+        try:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            # Empty files cannot be mapped
+            return _load_mesh_file(path_str)
+        with mm:
+            file_type = os.path.splitext(path_str)[1].lstrip('.').lower()
+            return _load_mesh_file(mm, file_type)
+
+
+def load_mesh_cached(full_path):
+    """Load a mesh file, reusing the parsed mesh for repeated paths.
+
+    Raises the (cached) load error if the file cannot be loaded. The returned
+    mesh is shared between callers: copy it before mutating.
+    """
+    mesh = _load_mesh_cached(str(full_path))
+    if isinstance(mesh, Exception):
+        raise mesh.with_traceback(None)
+    return mesh
+
+
+def _preload_mesh(path_str):
+    try:
+        _load_mesh_cached(path_str)
+    except Exception:
+        # Not cached; the caller's own load_mesh_cached() call reports it
+        pass
+
+
+def preload_meshes(paths, max_workers=8):
+    """Load each distinct mesh path once into the mesh cache, in parallel.
+
+    lru_cache does not serialize concurrent misses, so threads loading the
+    same file at the same time would each parse it. Deduplicating the paths
+    up front means every file is parsed once; later load_mesh_cached() calls
+    for these paths are cache hits. None entries (unresolved paths) are skipped.
+    """
+    unique = list(dict.fromkeys(str(p) for p in paths if p is not None))
+    if not unique:
+        return
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(unique))) as executor:
+        list(executor.map(_preload_mesh, unique))
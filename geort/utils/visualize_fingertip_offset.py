@@ -6,65 +6,79 @@ Works in WSL environment without needing real-time rendering.
 
 import numpy as np
 import trimesh
-import xml.etree.ElementTree as ET
 from pathlib import Path
 import argparse
+import functools
 import json
+import logging
+import os
+import sys
 from geort.utils.config_utils import get_config
+from geort.utils.urdf_utils import parse_urdf_for_links, resolve_mesh_path, load_mesh_cached, preload_meshes
+
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+logger = logging.getLogger(__name__)
 
 
 def parse_urdf_meshes(urdf_path):
     """Extract mesh information from URDF."""
-    tree = ET.parse(urdf_path)
-    root = tree.getroot()
-    
+    return _parse_urdf_meshes_cached(str(urdf_path))
+
+
+@functools.lru_cache(maxsize=16)
+def _parse_urdf_meshes_cached(urdf_path):
     link_meshes = {}
-    
-    for link in root.findall('link'):
-        link_name = link.get('name')
-        meshes = []
-        
-        # Get collision meshes
-        for collision in link.findall('collision'):
-            geometry = collision.find('geometry')
-            origin = collision.find('origin')
-            
-            origin_xyz = [0, 0, 0]
-            if origin is not None and origin.get('xyz'):
-                origin_xyz = [float(x) for x in origin.get('xyz').split()]
-            
-            if geometry is not None:
-                mesh_elem = geometry.find('mesh')
-                if mesh_elem is not None:
-                    meshes.append({
-                        'file': mesh_elem.get('filename'),
-                        'origin': origin_xyz
-                    })
-        
-        link_meshes[link_name] = meshes
+    # Single streaming pass, collision geometry only
+    for link_name, link_data in parse_urdf_for_links(urdf_path, None, parts=('collision',)).items():
+        link_meshes[link_name] = [
+            {'file': c['file'], 'origin': c['origin_xyz']}
+            for c in link_data['collision'] if c['type'] == 'mesh'
+        ]
     
     return link_meshes
 
 
 def load_mesh_from_urdf(mesh_path, urdf_dir):
     """Load mesh file referenced in URDF."""
-    if mesh_path.startswith('package://'):
-        mesh_path = mesh_path.replace('package://', '')
-    
-    full_path = Path(urdf_dir) / mesh_path
-    
-    if not full_path.exists():
-        alt_path = Path(urdf_dir) / mesh_path.split('meshes/')[-1]
-        if alt_path.exists():
-            full_path = alt_path
+    full_path = resolve_mesh_path(mesh_path, urdf_dir)
+    if full_path is None:
+        return None
     
-    if full_path.exists():
-        try:
-            return trimesh.load(str(full_path))
-        except:
-            pass
-    
-    return None
+    try:
+        # The cached mesh is shared, copy before translating / coloring it.
+        return load_mesh_cached(full_path).copy()
+    except (ValueError, OSError, ImportError) as e:
+        logger.debug("mesh load failed %s: %s", full_path, e)
+        return None
+
+
+@functools.lru_cache(maxsize=16)
+def _load_json_cached(path_str, mtime):
+    return _json_loads(Path(path_str).read_bytes())
+
+
+def _load_json(path):
+    """Load a JSON config, memoized by resolved path and mtime. Treat the result as read-only."""
+    path_str = os.path.realpath(path)
+    return _load_json_cached(path_str, os.path.getmtime(path_str))
+
+
+def _translate(xyz):
+    """4x4 homogeneous translation matrix."""
+    T = np.eye(4)
+    T[:3, 3] = xyz
+    return T
+
+
+def _set_face_colors(mesh, color):
+    """Assign one RGBA color to every face as a full (n_faces, 4) uint8 array."""
+    mesh.visual.face_colors = np.broadcast_to(
+        np.asarray(color, dtype=np.uint8), (len(mesh.faces), 4)).copy()
 
 
 def create_fingertip_visualization(config_path, hand_name, compare_config_path=None):
@@ -72,16 +86,14 @@ def create_fingertip_visualization(config_path, hand_name, compare_config_path=N
     
     # Load config
     if config_path:
-        with open(config_path, 'r') as f:
-            config = json.load(f)
+        config = _load_json(config_path)
     else:
         config = get_config(hand_name)
     
-    # Load comparison config if provided
+    # Load comparison config if provided (same file -> same cached object)
     compare_config = None
     if compare_config_path:
-        with open(compare_config_path, 'r') as f:
-            compare_config = json.load(f)
+        compare_config = _load_json(compare_config_path)
     
     urdf_path = config['urdf_path']
     urdf_dir = Path(urdf_path).parent
@@ -89,8 +101,8 @@ def create_fingertip_visualization(config_path, hand_name, compare_config_path=N
     # Parse URDF to get meshes
     link_meshes = parse_urdf_meshes(urdf_path)
     
-    # Create scene
-    scene = trimesh.Scene()
+    # Geometry is collected by node name; the scene is built once at the end
+    geometry = {}
     
     colors = [
         [255, 0, 0, 255],      # Red for index
@@ -100,17 +112,42 @@ def create_fingertip_visualization(config_path, hand_name, compare_config_path=N
         [255, 0, 255, 255],    # Magenta for thumb
     ]
     
-    print("\n" + "="*80)
-    print("CREATING FINGERTIP VISUALIZATION")
-    print("="*80 + "\n")
+    logger.info("\n%s", "=" * 80)
+    logger.info("CREATING FINGERTIP VISUALIZATION")
+    logger.info("%s\n", "=" * 80)
+    
+    # Marker primitives are identical for every finger: build them once and copy
+    base_marker = trimesh.creation.icosphere(subdivisions=2, radius=0.003)
+    base_axis = trimesh.creation.axis(origin_size=0.002, transform=None)
+    if compare_config:
+        base_compare_marker = trimesh.creation.box(extents=[0.006, 0.006, 0.006])
+        # Unit height; each line scales it along Z to its length
+        base_line = trimesh.creation.cylinder(radius=0.0005, height=1.0)
     
-    for i, finger_info in enumerate(config['fingertip_link']):
+    # Per-finger offsets as (N, 3) arrays; each finger is spaced along X for clarity
+    spacing = 0.05
+    offsets = np.asarray([f['center_offset'] for f in config['fingertip_link']], dtype=np.float64)
+    finger_offsets = np.zeros_like(offsets)
+    finger_offsets[:, 0] = np.arange(len(offsets)) * spacing
+    marker_positions = offsets + finger_offsets
+    
+    # Compare-config offsets by finger name
+    compare_map = {f['name']: np.asarray(f['center_offset']) for f in compare_config['fingertip_link']} \
+        if compare_config else {}
+    
+    # Load every distinct fingertip mesh once, the reads overlapping in a thread
+    # pool; scene building below stays sequential and copies from the cache
+    fingers = config['fingertip_link']
+    preload_meshes(resolve_mesh_path(link_meshes[f['link']][0]['file'], urdf_dir)
+                   for f in fingers if link_meshes.get(f['link']))
+    
+    for i, finger_info in enumerate(fingers):
         finger_name = finger_info['name']
         link_name = finger_info['link']
-        offset = np.array(finger_info['center_offset'])
+        offset = offsets[i]
         
-        print(f"Processing {finger_name} (link: {link_name})")
-        print(f"  Offset: [{offset[0]:.4f}, {offset[1]:.4f}, {offset[2]:.4f}]")
+        logger.info("Processing %s (link: %s)", finger_name, link_name)
+        logger.info("  Offset: [%.4f, %.4f, %.4f]", *offset)
         
         # Load fingertip mesh
         if link_name in link_meshes and link_meshes[link_name]:
@@ -118,86 +155,87 @@ def create_fingertip_visualization(config_path, hand_name, compare_config_path=N
             mesh = load_mesh_from_urdf(mesh_info['file'], urdf_dir)
             
             if mesh is not None:
-                # Apply origin offset if any
-                mesh_origin = np.array(mesh_info['origin'])
-                if not np.allclose(mesh_origin, 0):
-                    mesh.apply_translation(mesh_origin)
+                finger_offset = finger_offsets[i]
                 
-                # Offset each finger in 3D space for better visualization
-                spacing = 0.05
-                finger_offset = np.array([i * spacing, 0, 0])
-                mesh.apply_translation(finger_offset)
+                # Apply origin offset and finger spacing in a single vertex pass
+                mesh_origin = mesh_info['origin']
+                mesh.apply_transform(_translate(mesh_origin + finger_offset))
                 
                 # Set color for the mesh
-                mesh.visual.face_colors = colors[i]
+                _set_face_colors(mesh, colors[i])
                 
                 # Add mesh to scene
-                scene.add_geometry(mesh, node_name=f"{finger_name}_mesh")
+                geometry[f"{finger_name}_mesh"] = mesh
                 
                 # Create marker sphere at CURRENT offset position (solid sphere)
-                marker_pos = offset + finger_offset
-                marker = trimesh.creation.icosphere(subdivisions=2, radius=0.003)
-                marker.apply_translation(marker_pos)
-                marker.visual.face_colors = colors[i]
-                scene.add_geometry(marker, node_name=f"{finger_name}_current_marker")
+                marker_pos = marker_positions[i]
+                marker = base_marker.copy()
+                marker.apply_transform(_translate(marker_pos))
+                _set_face_colors(marker, colors[i])
+                
+                # Markers, lines and the frame are merged into one node per finger
+                markers = [marker]
                 
                 # If compare config provided, add comparison offset marker
                 if compare_config:
                     # Find matching finger in compare config
-                    compare_offset = None
-                    for compare_finger in compare_config['fingertip_link']:
-                        if compare_finger['name'] == finger_name:
-                            compare_offset = np.array(compare_finger['center_offset'])
-                            break
+                    compare_offset = compare_map.get(finger_name)
                     
                     if compare_offset is not None:
                         # Create SUGGESTED offset marker (wireframe cube for distinction)
                         compare_pos = compare_offset + finger_offset
-                        compare_marker = trimesh.creation.box(extents=[0.006, 0.006, 0.006])
-                        compare_marker.apply_translation(compare_pos)
-                        compare_marker.visual.face_colors = colors[i]
-                        scene.add_geometry(compare_marker, node_name=f"{finger_name}_suggested_marker")
+                        compare_marker = base_compare_marker.copy()
+                        compare_marker.apply_transform(_translate(compare_pos))
+                        _set_face_colors(compare_marker, colors[i])
+                        markers.append(compare_marker)
                         
                         # Draw line between current and suggested using a thin cylinder
                         line_dir = compare_pos - marker_pos
                         line_length = np.linalg.norm(line_dir)
                         if line_length > 0:
                             line_center = (marker_pos + compare_pos) / 2
-                            line_cylinder = trimesh.creation.cylinder(radius=0.0005, height=line_length)
+                            line_cylinder = base_line.copy()
                             
-                            # Align cylinder with the line direction
+                            # Align cylinder with the line direction (Rodrigues from cross / dot,
+                            # no arccos; the cylinder is symmetric so antiparallel needs no rotation)
+                            # and move it to the line center with a single transform
                             z_axis = np.array([0, 0, 1])
                             line_axis = line_dir / line_length
-                            rotation_axis = np.cross(z_axis, line_axis)
-                            if np.linalg.norm(rotation_axis) > 1e-6:
-                                rotation_axis = rotation_axis / np.linalg.norm(rotation_axis)
-                                angle = np.arccos(np.clip(np.dot(z_axis, line_axis), -1, 1))
-                                rotation_matrix = trimesh.transformations.rotation_matrix(angle, rotation_axis)
-                                line_cylinder.apply_transform(rotation_matrix)
-                            
-                            line_cylinder.apply_translation(line_center)
-                            line_cylinder.visual.face_colors = [128, 128, 128, 255]  # Gray
-                            scene.add_geometry(line_cylinder, node_name=f"{finger_name}_line")
+                            v = np.cross(z_axis, line_axis)
+                            c = np.dot(z_axis, line_axis)
+                            s2 = v @ v
+                            R = np.eye(3)
+                            if s2 > 1e-12:
+                                K = np.array([[0, -v[2], v[1]],
+                                              [v[2], 0, -v[0]],
+                                              [-v[1], v[0], 0]])
+                                R = R + K + K @ K * ((1 - c) / s2)
+                            T = _translate(line_center)
+                            T[:3, :3] = R * [1, 1, line_length]  # scale the unit cylinder's Z column
+                            line_cylinder.apply_transform(T)
+                            _set_face_colors(line_cylinder, [128, 128, 128, 255])  # Gray
+                            markers.append(line_cylinder)
                         
                         diff = np.linalg.norm(compare_offset - offset)
-                        print(f"  Current (sphere):   [{offset[0]:7.4f}, {offset[1]:7.4f}, {offset[2]:7.4f}]")
-                        print(f"  Suggested (cube):   [{compare_offset[0]:7.4f}, {compare_offset[1]:7.4f}, {compare_offset[2]:7.4f}]")
-                        print(f"  Distance: {diff*1000:.2f} mm")
+                        logger.info("  Current (sphere):   [%7.4f, %7.4f, %7.4f]", *offset)
+                        logger.info("  Suggested (cube):   [%7.4f, %7.4f, %7.4f]", *compare_offset)
+                        logger.info("  Distance: %.2f mm", diff * 1000)
                 
                 # Add coordinate frame at mesh origin
-                axis = trimesh.creation.axis(origin_size=0.002, transform=None)
-                axis.apply_translation(finger_offset)
-                scene.add_geometry(axis, node_name=f"{finger_name}_frame")
+                axis = base_axis.copy()
+                axis.apply_transform(_translate(finger_offset))
+                markers.append(axis)
+                geometry[f"{finger_name}_markers"] = trimesh.util.concatenate(markers)
                 
-                print(f"  ✓ Added to visualization")
+                logger.info("  ✓ Added to visualization")
             else:
-                print(f"  ✗ Could not load mesh: {mesh_info['file']}")
+                logger.info("  ✗ Could not load mesh: %s", mesh_info['file'])
         else:
-            print(f"  ✗ No mesh found for link")
+            logger.info("  ✗ No mesh found for link")
         
-        print()
+        logger.info("")
     
-    return scene
+    return trimesh.Scene(geometry=geometry)
 
 
 def main():
@@ -215,6 +253,9 @@ def main():
     
     args = parser.parse_args()
     
+    # Per-finger diagnostics go through the module logger; print them on stdout
+    logging.basicConfig(level=logging.INFO, format='%(message)s', stream=sys.stdout)
+    
     # Create visualization
     scene = create_fingertip_visualization(args.config, args.hand, compare_config_path=args.compare_config)
     
@@ -225,9 +266,10 @@ def main():
         config_suffix = Path(args.config).stem if args.config else args.hand
         glb_path = f"fingertip_viz_{config_suffix}.glb"
     
-    # Export as GLB only
+    # Export as GLB only (no viewer is started, so this also works headless)
     try:
-        scene.export(glb_path)
+        # Vertex normals are not needed for these flat-colored markers
+        Path(glb_path).write_bytes(scene.export(file_type='glb', include_normals=False))
         
         print("="*80)
         print(f"\n✓ Visualization saved to: {glb_path}")